@@ -5,17 +5,33 @@
     compound_interest(principal, time, rate),
     compound_interest_with_payments(principal, payment, term, rate, end_of_period=False),
     savings_calculator(present_value, future_value, term, rate, end_of_period=True),
-    check(data1, data2, **kwargs),
     join(file1_data, file2_data, **kwargs),
     files_innerjoin(filename1, filename2, **kwargs),
     files_leftouterjoin(filename1, filename2, **kwargs),
     files_rightouterjoin(filename1, filename2, **kwargs),
     list_to_dict(data: list),
     dict_to_list(data: dict),
+    to_frame(data: list),
+    from_frame(dataframe),
     split_file(filename, split_cols: list)
 """
 
 import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
 
 
 def formatting(number):
@@ -30,18 +46,37 @@ def formatting(number):
     """
     number = round(number, 2)
 
-    if "." in str(number):
-        integer, frac = str(number).split(".")
+    if isinstance(number, int) or number.is_integer():
+        integer, frac = str(int(number)), ""
     else:
-        integer, frac = str(number), ""
+        integer, frac = str(number).split(".", 1)
 
-    for i in range(len(integer) - 3, 0, -2):
-        integer = integer[:i] + "," + integer[i:]
+    sign = "-" if integer.startswith("-") else ""
+    integer = integer.lstrip("-")
+
+    groups = [integer[max(i - 2, 0) : i] for i in range(len(integer) - 3, 0, -2)]
+    groups.reverse()
+    groups.append(integer[-3:])
 
     if frac:
         frac = "." + frac
 
-    return integer + frac
+    return sign + ",".join(groups) + frac
+
+
+@lru_cache(maxsize=4096)
+def _growth(rate, term):
+    """
+    Memoized compound growth factor (1 + rate) ** term.
+
+    Args:-
+        rate(float) :- Rate of interest.
+        term(int) :- Number of periods.
+
+    Return
+        Growth multiplier.
+    """
+    return (1 + rate) ** term
 
 
 def simple_interest(principal, time, rate):
@@ -71,7 +106,7 @@ def compound_interest(principal, time, rate):
     Return
         Total amount.
     """
-    return formatting(principal * ((1 + rate) ** time))
+    return formatting(principal * _growth(rate, time))
 
 
 def compound_interest_with_payments(
@@ -89,16 +124,20 @@ def compound_interest_with_payments(
     Return
         Total principal.
     """
-    amount = 0
-
     if not end_of_period:
         principal += payment
 
-    for _ in range(1, term):
-        amount = principal * (rate)
-        principal += amount + payment
+    periods = term - 1
 
-    return formatting(principal)
+    if periods <= 0:
+        return formatting(principal)
+
+    if rate == 0:
+        return formatting(principal + payment * periods)
+
+    growth = _growth(rate, periods)
+
+    return formatting(principal * growth + payment * (growth - 1) / rate)
 
 
 def savings_calculator(present_value, future_value, term, rate, end_of_period=True):
@@ -117,29 +156,165 @@ def savings_calculator(present_value, future_value, term, rate, end_of_period=Tr
     """
     if not end_of_period:
         rate /= 1 + rate
-    net_value = future_value - present_value * ((1 + rate) ** term)
-    principal = net_value / ((1 + rate) ** term - 1)
+    growth = _growth(rate, term)
+    net_value = future_value - present_value * growth
+    principal = net_value / (growth - 1)
 
     return formatting(principal)
 
 
-def check(data1, data2, **kwargs):
+# Probe sides smaller than this are joined serially; forking workers and
+# pickling the index only pays off on large inputs.
+_PARALLEL_THRESHOLD = 100_000
+
+# 1 MiB file buffer for csv I/O; the default 8 KiB means far more
+# syscalls on multi-GB files.
+_BUFFER_SIZE = 1 << 20
+
+
+def _open_csv(filename, mode="r"):
+    """
+    Open a csv file with a large buffer and csv-safe newline handling.
+
+    Args:-
+        filename(str) :- Name of file.
+        mode(str) :- File mode.
+
+    Return
+        Open file object.
+    """
+    return open(
+        filename, mode, encoding="utf-8", buffering=_BUFFER_SIZE, newline=""
+    )
+
+
+_worker_state = {}
+
+
+@lru_cache(maxsize=64)
+def _make_merger(left_keys, right_keys):
+    """
+    Generate a row merger specialized for one pair of row schemas.
+
+    The emitted function builds the same dict as {**left, **right} but
+    with every field name inlined as a literal, skipping the generic
+    unpacking path and intermediate dict resizes.
+
+    Args:-
+        left_keys(tuple) :- Keys of the probe-side rows.
+        right_keys(tuple) :- Keys of the build-side rows.
+
+    Return
+        Function merging a left and a right row into a new dict.
+    """
+    fields = [
+        f"{key!r}: r[{key!r}]" if key in right_keys else f"{key!r}: l[{key!r}]"
+        for key in left_keys
+    ] + [f"{key!r}: r[{key!r}]" for key in right_keys if key not in left_keys]
+
+    namespace = {}
+    exec(  # pylint: disable=exec-used
+        "def _merge(l, r):\n    return {" + ", ".join(fields) + "}", namespace
+    )
+
+    return namespace["_merge"]
+
+
+def _init_probe_worker(index, keys, schemas):
+    """
+    Store the shared hash index, keys and merger in a worker process.
+
+    Args:-
+        index(dict) :- Hash index built from the build-side rows.
+        keys(tuple) :- Join keys.
+        schemas(tuple) :- Probe-side and build-side row keys.
+    """
+    _worker_state["index"] = index
+    _worker_state["keys"] = keys
+    _worker_state["merger"] = _make_merger(*schemas)
+
+
+def _probe_rows(rows, index, keys, merger):
+    """
+    Probe rows against the hash index.
+
+    Args:-
+        rows(list) :- Probe-side rows.
+        index(dict) :- Hash index built from the build-side rows.
+        keys(tuple) :- Join keys.
+        merger(function) :- Merger for a probe-side and build-side row.
+
+    Return
+        joined(list) :- All probe rows, merged where matched.
+        matched(list) :- Merged rows only.
+    """
+    joined, matched = [], []
+
+    for data1 in rows:
+        matches = index.get(tuple(data1[key] for key in keys), ())
+
+        if not matches:
+            joined.append(data1)
+
+        for data2 in matches:
+            merged = merger(data1, data2)
+            matched.append(merged)
+            joined.append(merged)
+
+    return joined, matched
+
+
+def _probe_chunk(chunk):
     """
-    Check whether the key is present in both data.
+    Probe one chunk of rows against the index shared via the initializer.
 
     Args:-
-        data1(list) :- Data from file 1.
-        data2(list) :- Data from file 2.
-        **kwargs(dict) :- keys
+        chunk(list) :- Slice of the probe-side rows.
 
     Return
-        data if key is present else False
+        Joined and matched rows for the chunk.
     """
-    for key in kwargs.values():
-        if data1[key.lower()] != data2[key.lower()]:
-            return False
+    return _probe_rows(
+        chunk,
+        _worker_state["index"],
+        _worker_state["keys"],
+        _worker_state["merger"],
+    )
 
-    return data1, data2
+
+def _parallel_probe(rows, index, keys, schemas):
+    """
+    Probe rows against the hash index across a process pool.
+
+    Args:-
+        rows(list) :- Probe-side rows.
+        index(dict) :- Hash index built from the build-side rows.
+        keys(tuple) :- Join keys.
+        schemas(tuple) :- Probe-side and build-side row keys.
+
+    Return
+        joined(list) :- All probe rows, merged where matched.
+        matched(list) :- Merged rows only.
+    """
+    workers = os.cpu_count() or 1
+    chunk_size = -(-len(rows) // workers)
+    chunks = [
+        rows[start : start + chunk_size]
+        for start in range(0, len(rows), chunk_size)
+    ]
+
+    joined_data, data_list = [], []
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_probe_worker,
+        initargs=(index, keys, schemas),
+    ) as executor:
+        for joined, matched in executor.map(_probe_chunk, chunks):
+            joined_data.extend(joined)
+            data_list.extend(matched)
+
+    return joined_data, data_list
 
 
 def join(file1_data, file2_data, **kwargs):
@@ -151,131 +326,307 @@ def join(file1_data, file2_data, **kwargs):
         file2_data(list) :- Data from file 2.
 
     Return
-        file1_data(list) :- Modified data of File 1.
+        joined_data(list) :- Data of file 1 merged with matches from file 2.
         data_list(list) :- Common data
         keys(list) :- common keys.
     """
-    for key in kwargs.values():
-        if (
-            key.lower() not in file1_data[0].keys()
-            or key.lower() not in file2_data[0].keys()
-        ):
-            return None
+    keys = tuple(key.lower() for key in kwargs.values())
 
-    data_list = []
+    if not set(keys) <= file1_data[0].keys() & file2_data[0].keys():
+        return None
 
-    for data1 in file1_data:
-        for data2 in file2_data:
-            if check(data1, data2, **kwargs):
-                data1.update(data2)
-                data_list.append(data1)
+    index = {}
 
-    return file1_data, data_list, data_list[0].keys()
+    for data2 in file2_data:
+        index.setdefault(tuple(data2[key] for key in keys), []).append(data2)
 
+    fieldnames = list(file1_data[0]) + [
+        key for key in file2_data[0] if key not in file1_data[0]
+    ]
 
-def files_innerjoin(filename1, filename2, **kwargs):
+    schemas = (tuple(file1_data[0]), tuple(file2_data[0]))
+
+    if len(file1_data) < _PARALLEL_THRESHOLD:
+        joined_data, data_list = _probe_rows(
+            file1_data, index, keys, _make_merger(*schemas)
+        )
+    else:
+        joined_data, data_list = _parallel_probe(file1_data, index, keys, schemas)
+
+    return joined_data, data_list, fieldnames
+
+
+@lru_cache(maxsize=32)
+def _load_index(filename, _mtime_ns, _size, keys):
     """
-    Create a csv file with data from common keys.
+    Build and memoize the hash index for the build side of a join.
+
+    _mtime_ns and _size only key the cache, so a file that changed on
+    disk gets reparsed while repeat joins on the same file reuse the
+    index.
 
     Args:-
-        filename1(str) :- Name of file 1.
-        filename2(str) :- Name of file 2.
+        filename(str) :- Name of the build-side file.
+        _mtime_ns(int) :- Modification time of the file.
+        _size(int) :- Size of the file.
+        keys(tuple) :- Join keys.
 
     Return
-        Data with common keys.
+        Header of the file and the hash index, or None for the index
+        when a join key is missing from the header.
     """
-    if not kwargs:
-        return None
+    with _open_csv(filename) as build_file:
+        csvreader = csv.reader(build_file)
+        build_fields = next(csvreader, [])
+        build_pos = {field: i for i, field in enumerate(build_fields)}
+
+        for key in keys:
+            if key not in build_pos:
+                return build_fields, None
+
+        key_idx = [build_pos[key] for key in keys]
+        index = {}
+
+        for row in csvreader:
+            index.setdefault(tuple(row[i] for i in key_idx), []).append(row)
+
+    return build_fields, index
+
+
+def _merge_plan(probe_fields, build_fields):
+    """
+    Lay out the output columns of a streamed join.
+
+    Shared columns take the build-side value on a match, mirroring the
+    override order of the old {**row, **match} merge.
+
+    Args:-
+        probe_fields(list) :- Header of the probe-side file.
+        build_fields(list) :- Header of the build-side file.
+
+    Return
+        fieldnames(list) :- Output header.
+        plan(list) :- (from_build, index) source of each output column.
+    """
+    build_pos = {field: i for i, field in enumerate(build_fields)}
+    extra_idx = [
+        i for i, field in enumerate(build_fields) if field not in probe_fields
+    ]
+    fieldnames = probe_fields + [build_fields[i] for i in extra_idx]
+    plan = [
+        (True, build_pos[field]) if field in build_pos else (False, i)
+        for i, field in enumerate(probe_fields)
+    ] + [(True, i) for i in extra_idx]
+
+    return fieldnames, plan
+
+
+def _write_result(csvreader, index, key_idx, layout, outer):
+    """
+    Stream probe rows through the hash index into result.csv.
+
+    Args:-
+        csvreader(reader) :- Probe-side reader positioned after the header.
+        index(dict) :- Hash index built from the build-side rows.
+        key_idx(list) :- Positions of the join keys in a probe row.
+        layout(tuple) :- Output header and column plan from _merge_plan.
+        outer(bool) :- Keep unmatched rows from the probe file.
+
+    Return
+        Number of rows written.
+    """
+    fieldnames, plan = layout
+    count = 0
 
-    with open(filename1, "r", encoding="utf-8") as f1:
-        csvreader = csv.DictReader(f1)
-        file1_data = list(csvreader)
+    with _open_csv("result.csv", "w") as result:
+        csvwriter = csv.writer(result)
+        csvwriter.writerow(fieldnames)
 
-    with open(filename2, "r", encoding="utf-8") as f2:
-        csvreader = csv.DictReader(f2)
-        file2_data = list(csvreader)
+        for row in csvreader:
+            matches = index.get(tuple(row[i] for i in key_idx), ())
 
-    output = join(file1_data, file2_data, **kwargs)
+            if not matches and outer:
+                csvwriter.writerow(row + [""] * (len(plan) - len(row)))
+                count += 1
 
-    if not output:
+            for match in matches:
+                csvwriter.writerow(
+                    [match[i] if from_build else row[i] for from_build, i in plan]
+                )
+                count += 1
+
+    return count
+
+
+def _stream_join(probe_filename, build_filename, keys, outer=False):
+    """
+    Stream-join two csv files into result.csv.
+
+    Args:-
+        probe_filename(str) :- Name of file scanned row by row.
+        build_filename(str) :- Name of file loaded into the hash index.
+        keys(list) :- Join keys.
+        outer(bool) :- Keep unmatched rows from the probe file.
+
+    Return
+        Number of rows written to result.csv.
+    """
+    stat = os.stat(build_filename)
+    build_fields, index = _load_index(
+        build_filename, stat.st_mtime_ns, stat.st_size, tuple(keys)
+    )
+
+    if index is None:
         return None
 
-    with open("result.csv", "w", encoding="utf-8") as result:
-        csvwriter = csv.DictWriter(result, fieldnames=output[2])
-        csvwriter.writeheader()
-        csvwriter.writerows(output[1])
+    with _open_csv(probe_filename) as probe_file:
+        csvreader = csv.reader(probe_file)
+        probe_fields = next(csvreader, [])
 
-    return output[1]
+        if any(key not in probe_fields for key in keys):
+            return None
 
+        key_idx = [probe_fields.index(key) for key in keys]
+        layout = _merge_plan(probe_fields, build_fields)
 
-def files_leftouterjoin(filename1, filename2, **kwargs):
+        return _write_result(csvreader, index, key_idx, layout, outer)
+
+
+def _read_frame(filename):
     """
-    Create a csv file with data from file1 and common keys in file2.
+    Read a csv file into a pandas DataFrame of strings, memoized.
+
+    Args:-
+        filename(str) :- Name of file.
+
+    Return
+        DataFrame with every column read as str.
+    """
+    stat = os.stat(filename)
+
+    return _load_frame(filename, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _load_frame(filename, _mtime_ns, _size):
+    """
+    Parse a csv file into a DataFrame of strings.
+
+    Uses pyarrow's multi-threaded C++ parser when available and falls
+    back to pandas.read_csv otherwise. _mtime_ns and _size only key the
+    cache so stale entries are not reused after the file changes.
+
+    Args:-
+        filename(str) :- Name of file.
+        _mtime_ns(int) :- Modification time of the file.
+        _size(int) :- Size of the file.
+
+    Return
+        DataFrame with every column read as str.
+    """
+    if pacsv is None:
+        return pd.read_csv(filename, dtype=str)
+
+    with _open_csv(filename) as f:
+        header = next(csv.reader(f), [])
+
+    table = pacsv.read_csv(
+        filename,
+        read_options=pacsv.ReadOptions(block_size=8 << 20),
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in header}
+        ),
+    )
+
+    return table.to_pandas()
+
+
+def _join_csvs(filename1, filename2, how, on):
+    """
+    Join two csv files into result.csv, via pandas when available.
 
     Args:-
         filename1(str) :- Name of file 1.
         filename2(str) :- Name of file 2.
+        how(str) :- Join type ('inner', 'left' or 'right').
+        on(list) :- Join keys.
 
     Return
-        Data from file1 and file2 of common keys.
+        Number of rows written to result.csv.
     """
-    if not kwargs:
-        return None
+    if pd is None:
+        if how == "right":
+            return _stream_join(filename2, filename1, on, outer=True)
+        return _stream_join(filename1, filename2, on, outer=how == "left")
 
-    with open(filename1, "r", encoding="utf-8") as f1:
-        csvreader = csv.DictReader(f1)
-        file1_data = list(csvreader)
+    df1 = _read_frame(filename1)
+    df2 = _read_frame(filename2)
+
+    for key in on:
+        if key not in df1.columns or key not in df2.columns:
+            return None
+
+    merged = df1.merge(df2, on=on, how=how, validate="m:m")
+    merged.to_csv("result.csv", index=False)
+
+    return len(merged)
 
-    with open(filename2, "r", encoding="utf-8") as f2:
-        csvreader = csv.DictReader(f2)
-        file2_data = list(csvreader)
 
-    output = join(file1_data, file2_data, **kwargs)
+def files_innerjoin(filename1, filename2, **kwargs):
+    """
+    Create a csv file with data from common keys.
 
-    if not output:
+    Args:-
+        filename1(str) :- Name of file 1.
+        filename2(str) :- Name of file 2.
+
+    Return
+        Number of rows written.
+    """
+    if not kwargs:
         return None
 
-    with open("result.csv", "w", encoding="utf-8") as result:
-        csvwriter = csv.DictWriter(result, fieldnames=output[2])
-        csvwriter.writeheader()
-        csvwriter.writerows(output[0])
+    keys = [key.lower() for key in kwargs.values()]
 
-    return output[0]
+    return _join_csvs(filename1, filename2, "inner", keys)
 
 
-def files_rightouterjoin(filename1, filename2, **kwargs):
+def files_leftouterjoin(filename1, filename2, **kwargs):
     """
-    Create a csv file with data from file2 and common keys in file1.
+    Create a csv file with data from file1 and common keys in file2.
 
     Args:-
         filename1(str) :- Name of file 1.
         filename2(str) :- Name of file 2.
 
     Return
-        Data from file2 and file1 of common keys.
+        Number of rows written.
     """
     if not kwargs:
         return None
 
-    with open(filename1, "r", encoding="utf-8") as f1:
-        csvreader = csv.DictReader(f1)
-        file1_data = list(csvreader)
+    keys = [key.lower() for key in kwargs.values()]
+
+    return _join_csvs(filename1, filename2, "left", keys)
+
 
-    with open(filename2, "r", encoding="utf-8") as f2:
-        csvreader = csv.DictReader(f2)
-        file2_data = list(csvreader)
+def files_rightouterjoin(filename1, filename2, **kwargs):
+    """
+    Create a csv file with data from file2 and common keys in file1.
 
-    output = join(file2_data, file1_data, **kwargs)
+    Args:-
+        filename1(str) :- Name of file 1.
+        filename2(str) :- Name of file 2.
 
-    if not output:
+    Return
+        Number of rows written.
+    """
+    if not kwargs:
         return None
 
-    with open("result.csv", "w", encoding="utf-8") as result:
-        csvwriter = csv.DictWriter(result, fieldnames=output[2])
-        csvwriter.writeheader()
-        csvwriter.writerows(output[0])
+    keys = [key.lower() for key in kwargs.values()]
 
-    return output[0]
+    return _join_csvs(filename1, filename2, "right", keys)
 
 
 def list_to_dict(data: list):
@@ -288,16 +639,23 @@ def list_to_dict(data: list):
     Return
         Dictionaries of lists.
     """
-    dictionary = {}
+    if not data:
+        return {}
+
+    keys = list(data[0])
+
+    if any(list(employee) != keys for employee in data):
+        dictionary = {}
 
-    for employee in data:
-        for key, value in employee.items():
-            if key in dictionary:
-                dictionary[key] += [value]
-            else:
-                dictionary[key] = [value]
+        for employee in data:
+            for key, value in employee.items():
+                dictionary.setdefault(key, []).append(value)
 
-    return dictionary
+        return dictionary
+
+    columns = zip(*(employee.values() for employee in data))
+
+    return {key: list(column) for key, column in zip(keys, columns)}
 
 
 def dict_to_list(data: dict):
@@ -310,56 +668,106 @@ def dict_to_list(data: dict):
     Return
         List of dictionaries.
     """
-    n = len(data[list(data.keys())[0]])
+    keys = tuple(data)
 
-    return [{key: value[i] for key, value in data.items()} for i in range(n)]
+    return [dict(zip(keys, row)) for row in zip(*data.values())]
 
 
-def split_file(filename, split_cols: list):
+def to_frame(data: list):
     """
-    Split data from large csv files to separate csv files as per split_cols.
+    Convert list of dictionaries to a pandas DataFrame.
+
+    The DataFrame holds columns in contiguous NumPy buffers, so for
+    numeric pipelines prefer it over the dict-of-lists format.
 
     Args:-
-        filename(str) :- Name of file.
+        data(list) :- List of dictionaries.
+
+    Return
+        DataFrame with one column per key.
+    """
+    if pd is None:
+        raise ImportError("pandas is required for to_frame")
+
+    return pd.DataFrame(data)
+
+
+def from_frame(dataframe):
+    """
+    Convert a pandas DataFrame to list of dictionaries.
+
+    Args:-
+        dataframe(DataFrame) :- DataFrame to convert.
+
+    Return
+        List of dictionaries, one per row.
+    """
+    return dataframe.to_dict("records")
+
+
+def _split_rows(csvreader, header, split_cols, files, writers):
+    """
+    Dispatch csv rows into lazily-opened per-bucket writers.
+
+    Files opened here are recorded in files so the caller can close them
+    even if a row fails midway.
+
+    Args:-
+        csvreader(reader) :- Reader positioned after the header row.
+        header(list) :- Header of the input file.
         split_cols(list) :- List of keys.
+        files(dict) :- Bucket to open file mapping, filled here.
+        writers(dict) :- Bucket to csv writer mapping, filled here.
     """
+    status_of = {}
+    city_idx = header.index(split_cols[0])
+    marital_idx = header.index(split_cols[1])
+    keep_idx = [i for i, field in enumerate(header) if field not in split_cols]
+    keys = [header[i] for i in keep_idx]
+
+    for row in csvreader:
+        marital = row[marital_idx]
+        status = status_of.get(marital)
 
-    with open(filename, "r", encoding="utf-8") as f:
-        csvreader = csv.DictReader(f)
-        file_data = list(csvreader)
+        if status is None:
+            status = "unmarried" if "unmarried" in marital else "married"
+            status_of[marital] = status
 
-    cities = {data[split_cols[0]] for data in file_data}
-    keys = file_data[0].keys() - split_cols
+        bucket = (row[city_idx], status)
 
-    for city in cities:
-        married_list, unmarried_list = [], []
+        if bucket not in writers:
+            file = _open_csv(f"{bucket[0]}_{status}.csv", "w")
+            files[bucket] = file
+            writers[bucket] = csv.writer(file)
+            writers[bucket].writerow(keys)
 
-        married_city_filename = f"{city}" + "_married.csv"
-        unmarried_city_filename = f"{city}" + "_unmarried.csv"
+        writers[bucket].writerow([row[i] for i in keep_idx])
 
-        for entry in file_data:
-            dictionary = {}
 
-            if city in entry[split_cols[0]]:
-                for key in keys:
-                    dictionary[key] = entry[key]
+def split_file(filename, split_cols: list):
+    """
+    Split data from large csv files to separate csv files as per split_cols.
 
-                if not "unmarried" in entry[split_cols[1]]:
-                    married_list.append(dictionary)
-                else:
-                    unmarried_list.append(dictionary)
+    Args:-
+        filename(str) :- Name of file.
+        split_cols(list) :- List of keys.
+
+    Return
+        Names of the files created.
+    """
 
-                with open(married_city_filename, "w", encoding="utf-8") as f:
-                    csvwriter = csv.DictWriter(f, fieldnames=keys)
-                    csvwriter.writeheader()
-                    csvwriter.writerows(married_list)
+    files, writers = {}, {}
 
-                with open(unmarried_city_filename, "w", encoding="utf-8") as f:
-                    csvwriter = csv.DictWriter(f, fieldnames=keys)
-                    csvwriter.writeheader()
-                    csvwriter.writerows(unmarried_list)
+    try:
+        with _open_csv(filename) as f:
+            csvreader = csv.reader(f)
+            header = next(csvreader, [])
+            _split_rows(csvreader, header, split_cols, files, writers)
+    finally:
+        for file in files.values():
+            file.close()
 
-    return married_list, unmarried_list
+    return sorted(file.name for file in files.values())
 
 
 if __name__ == "__main__":